@@ -16,6 +16,24 @@ try:
 except ImportError:  # pragma: no cover
     ZoneInfo = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(raw: str) -> Any:
+    # orjson parses 2-3x faster than stdlib json when available.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_pretty(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 _FORBIDDEN_IDENTITY_STEMS = {"AGENTS", "BOOTSTRAP", "IDENTITY", "SOUL", "TOOLS", "USER", "HEARTBEAT"}
 
@@ -38,7 +56,8 @@ try:
 except ModuleNotFoundError:  # package execution path
     from node.schema import validate_payload, validate_required_fields
 
-REQUIRED_FIELDS = [
+# Ordered, never mutated — a tuple keeps that explicit.
+REQUIRED_FIELDS = (
     "strategy_type",
     "risk_tolerance",
     "leverage_allowed",
@@ -46,7 +65,7 @@ REQUIRED_FIELDS = [
     "base_currency",
     "time_horizon",
     "liquidity_constraints",
-]
+)
 
 ALLOWED_PORTFOLIO_MODES = {"capital", "research"}
 METRIC_KEYS = ["total_return", "cagr", "vol", "sharpe", "max_drawdown", "turnover"]
@@ -132,7 +151,7 @@ class NodeAgent:
 
         _assert_root_write_allowed(json_path)
         _assert_root_write_allowed(md_path)
-        json_path.write_text(json.dumps(machine_contract, indent=2), encoding="utf-8")
+        json_path.write_text(_dumps_pretty(machine_contract), encoding="utf-8")
         md_path.write_text(human_brief, encoding="utf-8")
 
         return {
@@ -332,7 +351,7 @@ class NodeAgent:
 def _read_json_arg(raw: str) -> Dict[str, Any]:
     if not raw:
         return {}
-    return json.loads(raw)
+    return _loads(raw)
 
 
 def main() -> int:
@@ -366,14 +385,14 @@ def main() -> int:
         payload = _read_json_arg(args.payload)
         result = agent.package(payload)
         if result["status"] == "refused":
-            print(json.dumps(result, indent=2))
+            print(_dumps_pretty(result))
             return 1
 
         print("FILES_CREATED:")
         print(f"- {result['json_path']}")
         print(f"- {result['markdown_path']}")
         print("\nMACHINE_CONTRACT_PREVIEW:")
-        print(json.dumps(result["machine_contract"], indent=2))
+        print(_dumps_pretty(result["machine_contract"]))
         print("\nHUMAN_BRIEF_PREVIEW:")
         print(result["human_brief_preview"])
         return 0
@@ -3,6 +3,11 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None  # type: ignore[assignment]
+
 ALLOCATION_REQUEST_SCHEMA: Dict[str, Any] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "$id": "node/allocation_request.schema.json",
@@ -71,31 +76,62 @@ ALLOCATION_REQUEST_SCHEMA: Dict[str, Any] = {
 }
 
 
+# Compiled once at import; fastjsonschema generates specialized validation
+# code that is far faster than walking the schema per call.
+_COMPILED_VALIDATOR = (
+    fastjsonschema.compile(ALLOCATION_REQUEST_SCHEMA, use_default=False)
+    if fastjsonschema is not None
+    else None
+)
+
+# Constant schema lookups bound once at import instead of re-walking the
+# nested schema dict on every fallback validation.
+_PROPS = ALLOCATION_REQUEST_SCHEMA["properties"]
+_STRATEGY_TYPES = frozenset(_PROPS["strategy_type"]["enum"])
+_RISK_TOLERANCES = frozenset(_PROPS["risk_tolerance"]["enum"])
+_INVESTMENT_VEHICLES = frozenset(_PROPS["investment_vehicle"]["enum"])
+_OBJECTIVES = frozenset(_PROPS["time_horizon"]["properties"]["objective"]["enum"])
+_REDEMPTION_WINDOWS = frozenset(
+    _PROPS["liquidity_constraints"]["properties"]["redemption_window"]["enum"]
+)
+_USER_PROFILES = frozenset(_PROPS["user_profile"]["enum"])
+_CURRENCY_RE = re.compile(_PROPS["base_currency"]["pattern"])
+
+
 def validate_required_fields(payload: Dict[str, Any]) -> List[str]:
     required = ALLOCATION_REQUEST_SCHEMA["required"]
     return [field for field in required if field not in payload]
 
 
 def validate_payload(payload: Dict[str, Any]) -> List[str]:
+    if _COMPILED_VALIDATOR is not None:
+        try:
+            _COMPILED_VALIDATOR(payload)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            # Fall through to the field-by-field checks below so callers
+            # keep getting the detailed per-field error messages.
+            pass
+
     errors: List[str] = []
     missing = validate_required_fields(payload)
     if missing:
         errors.extend([f"Missing required field: {m}" for m in missing])
         return errors
 
-    if payload.get("strategy_type") not in ALLOCATION_REQUEST_SCHEMA["properties"]["strategy_type"]["enum"]:
+    if payload.get("strategy_type") not in _STRATEGY_TYPES:
         errors.append("Invalid strategy_type")
 
-    if payload.get("risk_tolerance") not in ALLOCATION_REQUEST_SCHEMA["properties"]["risk_tolerance"]["enum"]:
+    if payload.get("risk_tolerance") not in _RISK_TOLERANCES:
         errors.append("Invalid risk_tolerance")
 
     if not isinstance(payload.get("leverage_allowed"), bool):
         errors.append("leverage_allowed must be boolean")
 
-    if payload.get("investment_vehicle") not in ALLOCATION_REQUEST_SCHEMA["properties"]["investment_vehicle"]["enum"]:
+    if payload.get("investment_vehicle") not in _INVESTMENT_VEHICLES:
         errors.append("Invalid investment_vehicle")
 
-    if not isinstance(payload.get("base_currency"), str) or not re.match(r"^[A-Z]{3}$", payload["base_currency"]):
+    if not isinstance(payload.get("base_currency"), str) or not _CURRENCY_RE.match(payload["base_currency"]):
         errors.append("base_currency must be 3-letter uppercase ISO code")
 
     th = payload.get("time_horizon")
@@ -106,7 +142,7 @@ def validate_payload(payload: Dict[str, Any]) -> List[str]:
         objective = th.get("objective")
         if not isinstance(years, (int, float)) or years < 0.5 or years > 100:
             errors.append("time_horizon.years must be between 0.5 and 100")
-        if objective not in ALLOCATION_REQUEST_SCHEMA["properties"]["time_horizon"]["properties"]["objective"]["enum"]:
+        if objective not in _OBJECTIVES:
             errors.append("Invalid time_horizon.objective")
 
     lc = payload.get("liquidity_constraints")
@@ -115,13 +151,13 @@ def validate_payload(payload: Dict[str, Any]) -> List[str]:
     else:
         rw = lc.get("redemption_window")
         lockup = lc.get("max_lockup_days")
-        if rw not in ALLOCATION_REQUEST_SCHEMA["properties"]["liquidity_constraints"]["properties"]["redemption_window"]["enum"]:
+        if rw not in _REDEMPTION_WINDOWS:
             errors.append("Invalid liquidity_constraints.redemption_window")
         if not isinstance(lockup, int) or lockup < 0 or lockup > 3650:
             errors.append("liquidity_constraints.max_lockup_days must be integer 0..3650")
 
     up = payload.get("user_profile")
-    if up is not None and up not in ["retail", "sophisticated"]:
+    if up is not None and up not in _USER_PROFILES:
         errors.append("user_profile must be retail|sophisticated")
 
     return errors
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import base64
+import functools
 import io
 import math
 import subprocess
@@ -13,9 +14,8 @@ _venv_site = Path(".venv/lib/python3.12/site-packages")
 if _venv_site.exists():
     sys.path.insert(0, str(_venv_site))
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import yaml
 
 from portfolio_engine.engine import PortfolioEngine
 from templates.report_template import render_strategy_report
@@ -30,7 +30,6 @@ PORTFOLIO_WEIGHTS_PATH = _REPO_ROOT / "inputs" / "portfolios" / "portfolio_weigh
 PORTFOLIO_METADATA_PATH = _REPO_ROOT / "inputs" / "portfolios" / "portfolio_metadata.csv"
 SYMBOL_MAP = {"AGG": "TLT"}
 
-
 def _resolve_system_mode(mode: str) -> str:
     allowed = {"capital", "research"}
     if mode not in allowed:
@@ -50,15 +49,23 @@ def ann_std(xs: pd.Series) -> float:
     return float(xs.std(ddof=1) * math.sqrt(12)) if len(xs) > 1 else 0.0
 
 
-def max_drawdown(equity: pd.Series) -> float:
-    dd = equity / equity.cummax() - 1.0
-    return float(dd.min())
+def max_drawdown(equity) -> float:
+    eq = np.asarray(equity, dtype=np.float64)
+    peaks = np.maximum.accumulate(eq)
+    return float((eq / peaks - 1.0).min())
 
 
 def fig_to_base64(fig) -> str:
+    # Render through a dedicated Agg canvas; the pyplot state machine is
+    # never involved, so there is nothing to close.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=120, bbox_inches="tight")
-    plt.close(fig)
+    # compress_level=1: PNG zlib at max compression dominates render time;
+    # these are embedded report charts, so trade a slightly larger blob for it.
+    FigureCanvasAgg(fig).print_figure(
+        buf, format="png", dpi=120, bbox_inches="tight", pil_kwargs={"compress_level": 1}
+    )
     return base64.b64encode(buf.getvalue()).decode("utf-8")
 
 
@@ -70,6 +77,40 @@ def _to_engine_symbol(ticker: str) -> str:
     return SYMBOL_MAP.get(ticker, ticker)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_csv(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse a CSV once per on-disk version; mtime in the key invalidates on edit."""
+    return pd.read_csv(path_str)
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_price_columns(path_str: str, mtime_ns: int) -> frozenset[str]:
+    """Column names from the parquet footer; no row data is decoded."""
+    import pyarrow.parquet as pq
+
+    return frozenset(pq.read_schema(path_str).names)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_price_frame(path_str: str, mtime_ns: int, columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    """Decode and index-normalize the price parquet once per on-disk version.
+
+    Passing `columns` pushes the projection into the parquet reader so
+    unused ticker columns are never decoded.
+    """
+    df = pd.read_parquet(path_str, columns=list(columns) if columns is not None else None)
+    if not isinstance(df.index, pd.DatetimeIndex):
+        if "date" in df.columns:
+            df = df.set_index("date")
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("Dataset index must be DatetimeIndex")
+
+    df.index = pd.to_datetime(df.index)
+    if df.index.tz is not None:
+        df.index = df.index.tz_convert(None)
+    return df.sort_index()
+
+
 def load_portfolio_from_csv(portfolio_id: str, mode: str = "capital") -> tuple[dict, Path]:
     mode = _resolve_system_mode(mode)
     canonical_id = portfolio_id.replace("-", "_")
@@ -79,8 +120,8 @@ def load_portfolio_from_csv(portfolio_id: str, mode: str = "capital") -> tuple[d
     if not PORTFOLIO_WEIGHTS_PATH.exists():
         raise FileNotFoundError(f"Missing portfolio weights CSV: {PORTFOLIO_WEIGHTS_PATH}")
 
-    templates = pd.read_csv(PORTFOLIO_TEMPLATES_PATH)
-    weights = pd.read_csv(PORTFOLIO_WEIGHTS_PATH)
+    templates = _cached_csv(str(PORTFOLIO_TEMPLATES_PATH), PORTFOLIO_TEMPLATES_PATH.stat().st_mtime_ns)
+    weights = _cached_csv(str(PORTFOLIO_WEIGHTS_PATH), PORTFOLIO_WEIGHTS_PATH.stat().st_mtime_ns)
 
     sel = templates[(templates["mode"] == mode) & (templates["portfolio_id"].astype(str).str.replace("-", "_", regex=False) == canonical_id)]
     if sel.empty:
@@ -108,7 +149,7 @@ def load_portfolio_from_csv(portfolio_id: str, mode: str = "capital") -> tuple[d
     }
 
     if PORTFOLIO_METADATA_PATH.exists():
-        meta = pd.read_csv(PORTFOLIO_METADATA_PATH)
+        meta = _cached_csv(str(PORTFOLIO_METADATA_PATH), PORTFOLIO_METADATA_PATH.stat().st_mtime_ns)
         msel = meta[(meta["mode"] == mode) & (meta["portfolio_id"].astype(str).str.replace("-", "_", regex=False) == canonical_id)]
         for _, mr in msel.iterrows():
             key = str(mr["key"])
@@ -131,21 +172,18 @@ def _load_validated_prices(required_columns: list[str]) -> tuple[pd.DataFrame, d
     if not DATA_PATH.exists():
         raise FileNotFoundError("prices_master.parquet not found. Expected canonical market data at data/market/prices_master.parquet.")
 
-    df = pd.read_parquet(DATA_PATH)
-    if not set(required_columns).issubset(df.columns):
+    mtime_ns = DATA_PATH.stat().st_mtime_ns
+    available = _cached_price_columns(str(DATA_PATH), mtime_ns)
+    if not set(required_columns).issubset(available):
         raise ValueError(f"Dataset missing required columns. Expected: {required_columns}")
 
-    if not isinstance(df.index, pd.DatetimeIndex):
-        if "date" in df.columns:
-            df = df.set_index("date")
-        if not isinstance(df.index, pd.DatetimeIndex):
-            raise ValueError("Dataset index must be DatetimeIndex")
-
-    df.index = pd.to_datetime(df.index)
-    if df.index.tz is not None:
-        df.index = df.index.tz_convert(None)
+    # Read only the required tickers (plus the date column when it is stored
+    # as a regular column rather than the index).
+    projection = list(required_columns)
+    if "date" in available and "date" not in projection:
+        projection.append("date")
+    df = _cached_price_frame(str(DATA_PATH), mtime_ns, tuple(projection))
 
-    df = df.sort_index()
     raw_stats = {
         "RAW_START": str(df.index.min().date()),
         "RAW_END": str(df.index.max().date()),
@@ -174,6 +212,56 @@ def _load_validated_prices(required_columns: list[str]) -> tuple[pd.DataFrame, d
     return effective, {**raw_stats, **effective_stats}
 
 
+def _is_static_monthly(engine: PortfolioEngine) -> bool:
+    """True when the configured pipeline is a fixed-weight monthly rebalance."""
+    cfg = engine.config
+    return (
+        cfg.allocation_model.type == "beta_engine_60_40"
+        and cfg.rebalancer.type == "monthly"
+        and all(o.type in {"risk_overlay_none", "regime_overlay_none"} for o in cfg.overlays)
+        and cfg.allocator.type == "capital_allocator"
+    )
+
+
+def _simulate_static_kernel(
+    px: np.ndarray,
+    weights: np.ndarray,
+    rebalance_flags: np.ndarray,
+    initial_cash: float,
+    trade_order: list[int],
+) -> tuple[np.ndarray, list[float]]:
+    """Fixed-weight simulation over an (n_periods, n_assets) price matrix.
+
+    Replicates the engine pipeline arithmetic (allocate to pv*w/px targets on
+    rebalance periods, trades applied in sorted-symbol order) without the
+    per-period module dispatch.
+    """
+    n_periods, n_assets = px.shape
+    # Plain Python floats: scalar arithmetic is faster than NumPy scalar
+    # indexing at this width, and sum() keeps the engine path's compensated
+    # float summation so results match the reference pipeline bit-for-bit.
+    px_rows = px.tolist()
+    w = weights.tolist()
+    cash = initial_cash
+    positions = [0.0] * n_assets
+    equity = np.empty(n_periods, dtype=np.float64)
+    turnover_rows: list[float] = []
+
+    for i in range(n_periods):
+        row = px_rows[i]
+        pv = cash + sum(positions[j] * row[j] for j in range(n_assets))
+        if rebalance_flags[i]:
+            trades = [pv * w[j] / row[j] - positions[j] for j in range(n_assets)]
+            turnover_notional = sum(abs(trades[j]) * row[j] for j in trade_order)
+            turnover_rows.append(turnover_notional / pv if pv > 0 else 0.0)
+            for j in trade_order:
+                cash -= trades[j] * row[j]
+                positions[j] = positions[j] + trades[j]
+        equity[i] = cash + sum(positions[j] * row[j] for j in range(n_assets))
+
+    return equity, turnover_rows
+
+
 def _simulate_strategy(engine: PortfolioEngine, portfolio: dict, prices: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, float]:
     tickers = list(portfolio["tickers"].keys())
     engine_weights = {_to_engine_symbol(k): float(v) for k, v in portfolio["tickers"].items()}
@@ -181,34 +269,93 @@ def _simulate_strategy(engine: PortfolioEngine, portfolio: dict, prices: pd.Data
 
     engine_symbols = [_to_engine_symbol(t) for t in tickers]
     engine_to_portfolio = {_to_engine_symbol(t): t for t in tickers}
-    cash, positions, last_reb = 10000.0, {s: 0.0 for s in engine_symbols}, None
-    equity, weight_rows, turnover_rows = [], [], []
-
-    for dt, row in prices.iterrows():
-        as_of = dt.date()
-        px = {_to_engine_symbol(t): float(row[t]) for t in tickers}
-        pv = cash + sum(positions[s] * px[s] for s in positions)
-        out = engine.run(as_of, px, pv, positions, last_reb)
 
-        display_weights = {engine_to_portfolio.get(k, k): v for k, v in out["weights"].items()}
-        weight_rows.append({"date": as_of.isoformat(), **display_weights})
-
-        if out["should_rebalance"]:
-            turnover_notional = sum(abs(du) * px[s] for s, du in out["trades"].items())
-            turnover_rows.append(turnover_notional / pv if pv > 0 else 0.0)
-            for s, du in out["trades"].items():
-                cash -= du * px[s]
-                positions[s] = positions.get(s, 0.0) + du
-            last_reb = as_of
-        equity.append(cash + sum(positions[s] * px[s] for s in positions))
+    px_matrix = prices[tickers].to_numpy(dtype=np.float64)
+    as_of_dates = [ts.date() for ts in prices.index]
+
+    if _is_static_monthly(engine):
+        total = sum(engine_weights.values())
+        if total <= 0:
+            raise ValueError("Configured weights must sum to a positive value")
+        w_norm = np.asarray([engine_weights[s] / total for s in engine_symbols], dtype=np.float64)
+
+        # MonthlyRebalancer semantics vectorized: rebalance on the first
+        # sample, then whenever the calendar month changes. The tracked
+        # last-rebalance month always equals the previous sample's month,
+        # so the per-date should_rebalance loop reduces to this mask.
+        months = prices.index.year.to_numpy() * 12 + prices.index.month.to_numpy()
+        rebalance_flags = np.empty(len(months), dtype=bool)
+        rebalance_flags[0] = True
+        rebalance_flags[1:] = months[1:] != months[:-1]
+
+        trade_order = sorted(range(len(engine_symbols)), key=engine_symbols.__getitem__)
+        equity_arr, turnover_rows = _simulate_static_kernel(
+            px_matrix, w_norm, rebalance_flags, 10000.0, trade_order
+        )
+        equity = equity_arr
+        weights_df = pd.DataFrame(
+            {
+                "date": [d.isoformat() for d in as_of_dates],
+                **{engine_to_portfolio[s]: w for s, w in zip(engine_symbols, w_norm)},
+            }
+        )
+    else:
+        cash, positions, last_reb = 10000.0, {s: 0.0 for s in engine_symbols}, None
+        equity, weight_rows, turnover_rows = [], [], []
+        # One materialization of prices as Python floats; the px dict is
+        # reused across iterations (engine.run does not retain it). The
+        # positions array mirrors the dict so valuation is a dot product.
+        px_rows = px_matrix.tolist()
+        px: dict[str, float] = dict.fromkeys(engine_symbols, 0.0)
+        sym_to_idx = {s: j for j, s in enumerate(engine_symbols)}
+        positions_arr = np.zeros(len(engine_symbols), dtype=np.float64)
+        display_keys: list[str] | None = None
+        for i, as_of in enumerate(as_of_dates):
+            row = px_matrix[i]
+            for s, v in zip(engine_symbols, px_rows[i]):
+                px[s] = v
+            pv = float(cash + positions_arr @ row)
+            out = engine.run(as_of, px, pv, positions, last_reb, eager_allocations=False)
+
+            if display_keys is None:
+                display_keys = [engine_to_portfolio.get(k, k) for k in out["weights"]]
+            weight_rows.append({"date": as_of.isoformat(), **dict(zip(display_keys, out["weights"].values()))})
+
+            if out["should_rebalance"]:
+                turnover_notional = sum(abs(du) * px[s] for s, du in out["trades"].items())
+                turnover_rows.append(turnover_notional / pv if pv > 0 else 0.0)
+                for s, du in out["trades"].items():
+                    cash -= du * px[s]
+                    positions[s] = positions.get(s, 0.0) + du
+                    positions_arr[sym_to_idx[s]] += du
+                last_reb = as_of
+            equity.append(float(cash + positions_arr @ row))
+        weights_df = pd.DataFrame(weight_rows)
 
     df = pd.DataFrame({"date": prices.index, "portfolio_value": equity})
     df["monthly_return"] = df["portfolio_value"].pct_change().fillna(0.0)
-    weights_df = pd.DataFrame(weight_rows)
     turnover = float(sum(turnover_rows)) if turnover_rows else 0.0
     return df, weights_df, turnover
 
 
+def _rolling_mean_std(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Windowed mean and sample std computed together in one vectorized pass.
+
+    Returns full-length arrays with NaN for the first window-1 positions,
+    matching pandas' rolling(min_periods=window) alignment.
+    """
+    n = len(x)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n >= window:
+        sw = np.lib.stride_tricks.sliding_window_view(x, window)
+        m = sw.mean(axis=1)
+        dev = sw - m[:, None]
+        mean[window - 1 :] = m
+        std[window - 1 :] = np.sqrt((dev * dev).sum(axis=1) / (window - 1))
+    return mean, std
+
+
 def _build_canonical_dataset(
     df: pd.DataFrame,
     weights_df: pd.DataFrame,
@@ -220,23 +367,23 @@ def _build_canonical_dataset(
     base["date"] = pd.to_datetime(base["date"]).dt.date.astype(str)
     base["cumulative_return"] = (1 + base["monthly_return"]).cumprod() - 1
 
-    weights = weights_df.copy()
-    for t in tickers:
-        if t in weights.columns:
-            weights = weights.rename(columns={t: f"weight_{t}"})
+    weights = weights_df.rename(columns={t: f"weight_{t}" for t in tickers if t in weights_df.columns})
 
-    merged = base.merge(weights, on="date", how="left")
+    # Left-join semantics without a hash merge: align the weight columns to
+    # base's date order via reindex, then concat positionally.
+    aligned = weights.set_index("date").reindex(base["date"]).reset_index(drop=True)
+    merged = pd.concat([base, aligned], axis=1)
 
-    pv = merged["portfolio_value"].to_list()
-    rolling_cagr = [float("nan")] * len(pv)
-    for i in range(60, len(pv)):
-        rolling_cagr[i] = (pv[i] / pv[i - 60]) ** (1 / 5) - 1
+    pv = merged["portfolio_value"].to_numpy(dtype=np.float64)
+    rolling_cagr = np.full(len(pv), np.nan)
+    if len(pv) > 60:
+        rolling_cagr[60:] = (pv[60:] / pv[:-60]) ** (1 / 5) - 1
     merged["rolling_60m_cagr"] = rolling_cagr
 
-    roll_std = merged["monthly_return"].rolling(window=60).std(ddof=1) * math.sqrt(12)
-    roll_mean = merged["monthly_return"].rolling(window=60).mean() * 12
+    roll_mean, roll_sd = _rolling_mean_std(merged["monthly_return"].to_numpy(dtype=np.float64), 60)
+    roll_std = roll_sd * math.sqrt(12)
     merged["rolling_60m_vol"] = roll_std
-    merged["rolling_60m_sharpe"] = roll_mean / roll_std
+    merged["rolling_60m_sharpe"] = roll_mean * 12 / roll_std
 
     merged["strategy_name"] = strategy_name
     merged["publish_timestamp"] = publish_timestamp
@@ -255,10 +402,25 @@ def _build_canonical_dataset(
     return merged[ordered]
 
 
+_RAW_CONFIG_CACHE: dict[tuple[str, int], dict] = {}
+
+
+def _load_raw_config(config_path: Path) -> dict:
+    """Parse config.yaml with the C loader, memoized per on-disk version."""
+    import yaml
+
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    cached = _RAW_CONFIG_CACHE.get(key)
+    if cached is None:
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(config_path, "r", encoding="utf-8") as f:
+            cached = _RAW_CONFIG_CACHE[key] = yaml.load(f, Loader=loader)
+    return cached
+
+
 def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str | None = None, mode: str = "capital") -> None:
     config_path = _config_path(mode)
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f)
+    raw_config = _load_raw_config(config_path)
     engine = PortfolioEngine.from_yaml(str(config_path))
 
     portfolio, portfolio_path = _load_portfolio(strategy, mode=mode)
@@ -275,7 +437,10 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
     print(f"EFFECTIVE_ROWS: {stats['EFFECTIVE_ROWS']}")
     print(f"DATASET_TICKERS: {', '.join(tickers)}")
 
-    prices = prices_daily.groupby(prices_daily.index.to_period("M")).tail(1).copy()
+    # Last row per calendar month without building a groupby; keeps the
+    # actual trading dates (resample("ME") would rewrite them to calendar
+    # month-ends and synthesize rows for gap months).
+    prices = prices_daily[~prices_daily.index.to_period("M").duplicated(keep="last")]
     start_date = prices.index.min().date()
     end_date = prices.index.max().date()
     transaction_cost_bps = 0
@@ -301,15 +466,17 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
         print(f"CANONICAL_DATASET_PATH: {out_path}")
         print(f"CANONICAL_DATASET_CSV_PATH: {csv_path}")
 
-    monthly = canonical.copy()
+    monthly = canonical
     years = len(monthly.iloc[1:]) / 12
     total_return = float(monthly["portfolio_value"].iloc[-1] / monthly["portfolio_value"].iloc[0] - 1)
     cagr = float((1 + total_return) ** (1 / years) - 1) if years > 0 else 0.0
     vol = ann_std(monthly["monthly_return"].iloc[1:])
     sharpe = float((monthly["monthly_return"].iloc[1:].mean() * 12) / vol) if vol > 0 else 0.0
-    mdd = max_drawdown(monthly["portfolio_value"])
+    eq_arr = monthly["portfolio_value"].to_numpy(dtype=np.float64)
+    dd = eq_arr / np.maximum.accumulate(eq_arr) - 1.0
+    mdd = float(dd.min())
 
-    monthly_nonzero = monthly.iloc[1:].copy()
+    monthly_nonzero = monthly.iloc[1:]
     best_idx = monthly_nonzero["monthly_return"].idxmax()
     worst_idx = monthly_nonzero["monthly_return"].idxmin()
     best_month = str(monthly.loc[best_idx, "date"])
@@ -317,25 +484,40 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
     pct_pos = float((monthly_nonzero["monthly_return"] > 0).mean()) if len(monthly_nonzero) else 0.0
     turnover_annualised = (turnover / len(monthly_nonzero)) * 12 if len(monthly_nonzero) > 0 else 0.0
 
-    annual_returns = (
-        monthly_nonzero.assign(year=pd.to_datetime(monthly_nonzero["date"]).dt.year)
-        .groupby("year")["monthly_return"]
-        .apply(lambda x: (1 + x).prod() - 1)
-        .reset_index(name="annual_return")
-    )
-
-    fig1 = plt.figure(figsize=(9, 4))
-    plt.plot(pd.to_datetime(monthly["date"]), monthly["portfolio_value"], lw=2)
-    plt.title("Equity Curve")
-    plt.grid(alpha=0.3)
-    equity_b64 = fig_to_base64(fig1)
-
-    dd = monthly["portfolio_value"] / monthly["portfolio_value"].cummax() - 1.0
-    fig2 = plt.figure(figsize=(9, 3.5))
-    plt.plot(pd.to_datetime(monthly["date"]), dd, color="crimson", lw=2)
-    plt.title("Drawdown")
-    plt.grid(alpha=0.3)
-    drawdown_b64 = fig_to_base64(fig2)
+    # Years are contiguous in the monthly series, so compounding per year is
+    # one reduceat over the growth factors instead of a Python-lambda groupby.
+    years_arr = pd.to_datetime(monthly_nonzero["date"]).dt.year.to_numpy()
+    ret_arr = monthly_nonzero["monthly_return"].to_numpy(dtype=np.float64)
+    if len(ret_arr):
+        boundaries = np.r_[0, np.flatnonzero(np.diff(years_arr)) + 1]
+        annual_returns = pd.DataFrame(
+            {
+                "year": years_arr[boundaries],
+                "annual_return": np.multiply.reduceat(1.0 + ret_arr, boundaries) - 1.0,
+            }
+        )
+    else:
+        annual_returns = pd.DataFrame({"year": [], "annual_return": []})
+
+    from matplotlib.figure import Figure
+
+    # One Agg figure reused for both charts; figure construction dominates
+    # the draw calls, and skipping pyplot keeps the import surface lazy.
+    chart_dates = pd.to_datetime(monthly["date"])
+    fig = Figure(figsize=(9, 4))
+    ax = fig.add_subplot(111)
+    ax.plot(chart_dates, monthly["portfolio_value"], lw=2)
+    ax.set_title("Equity Curve")
+    ax.grid(alpha=0.3)
+    equity_b64 = fig_to_base64(fig)
+
+    fig.clear()
+    fig.set_size_inches(9, 3.5)
+    ax = fig.add_subplot(111)
+    ax.plot(chart_dates, dd, color="crimson", lw=2)
+    ax.set_title("Drawdown")
+    ax.grid(alpha=0.3)
+    drawdown_b64 = fig_to_base64(fig)
 
     def _fmt_pct(x: float) -> str:
         return f"{float(x) * 100:.2f}%"
@@ -357,11 +539,13 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
 
     weight_cols = [c for c in canonical.columns if c.startswith("weight_")]
     monthly_display = monthly[["date", "portfolio_value", "monthly_return", "cumulative_return", *weight_cols]].copy()
-    monthly_display["portfolio_value"] = monthly_display["portfolio_value"].map(lambda x: f"{float(x):.2f}")
-    monthly_display["monthly_return"] = monthly_display["monthly_return"].map(_fmt_pct)
-    monthly_display["cumulative_return"] = monthly_display["cumulative_return"].map(_fmt_pct)
-    for c in weight_cols:
-        monthly_display[c] = monthly_display[c].map(lambda x: _fmt_pct(float(x)) if pd.notna(x) else "")
+    # Bulk C-level printf over each column instead of a Python lambda per cell.
+    monthly_display["portfolio_value"] = np.char.mod("%.2f", monthly_display["portfolio_value"].to_numpy(dtype=np.float64))
+    for c in ("monthly_return", "cumulative_return"):
+        monthly_display[c] = np.char.mod("%.2f%%", monthly_display[c].to_numpy(dtype=np.float64) * 100)
+    if weight_cols:
+        warr = monthly_display[weight_cols].to_numpy(dtype=np.float64) * 100
+        monthly_display[weight_cols] = np.where(np.isnan(warr), "", np.char.mod("%.2f%%", warr))
 
     weight_alloc = pd.DataFrame(
         {
@@ -371,7 +555,7 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
     )
 
     annual_display = annual_returns.copy()
-    annual_display["annual_return"] = annual_display["annual_return"].map(lambda x: f"{x:.2%}")
+    annual_display["annual_return"] = np.char.mod("%.2f%%", annual_display["annual_return"].to_numpy(dtype=np.float64) * 100)
 
     cfg_engine = raw_config.get("engine", {})
     cfg_overlays = raw_config.get("overlays", {})
@@ -427,11 +611,11 @@ def run_backtest(strategy: str, publish: bool = False, output_dataset_path: str
         assert_not_forbidden_identity_root_file(archive_path)
         archive_path.write_text(html_report, encoding="utf-8")
 
-        git_cmd(["git", "add", str(report_path), str(archive_path)])
-        has_staged_changes = subprocess.call(["git", "diff", "--cached", "--quiet"]) != 0
-        if not has_staged_changes:
+        status = git_cmd(["git", "status", "--porcelain", "--", str(report_path), str(archive_path)])
+        if not status:
             print("PUBLISH: No changes detected. Skipping commit.")
         else:
+            git_cmd(["git", "add", str(report_path), str(archive_path)])
             git_cmd(["git", "commit", "-m", f"Add report {strategy_slug}.html"])
             git_cmd(["git", "push"])
             print("PUBLISH: Report committed and pushed.")
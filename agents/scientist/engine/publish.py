@@ -15,48 +15,25 @@ def run(cmd: list[str], cwd: Path) -> str:
     return subprocess.check_output(cmd, cwd=str(cwd), text=True).strip()
 
 
-def regenerate_index(repo_root: Path, mode: str) -> None:
-    runs = repo_root / "outputs" / mode / "runs"
-    archive = repo_root / "outputs" / mode / "archive"
-    runs.mkdir(parents=True, exist_ok=True)
-    archive.mkdir(parents=True, exist_ok=True)
-
-    current_files = sorted([p for p in runs.glob("*.html") if p.name != "index.html"])
-    archive_files = sorted([p for p in archive.glob("*.html")])
-
-    current_rows = report_rows_for_index(current_files)
-    archive_rows = report_rows_for_index(archive_files)
-
-    def _rows_html(rows: list[tuple[str, str, float, str]], prefix: str = "") -> str:
-        if not rows:
-            return "<tr><td colspan='4'>No reports found.</td></tr>"
-        out = []
-        count = len(rows)
-        for i, (fname, stem, _, dt) in enumerate(rows):
-            n = count - i
-            link = f"{prefix}{fname}"
-            out.append(f"<tr><td class='num'>{n}</td><td>{stem}</td><td>{dt}</td><td><a href='{link}'>{fname}</a></td></tr>")
-        return "\n".join(out)
-
-    current_tbody = _rows_html(current_rows, "")
-    archive_tbody = _rows_html(archive_rows, "archive/")
-
-    html = f"""<!doctype html>
+# Static page skeleton held as constants; only the two table bodies change
+# between runs, so the ~1 KB head (with its brace-heavy CSS) is never pushed
+# back through f-string formatting.
+_INDEX_HEAD = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>MS Report Dashboard</title>
   <style>
-    body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif; margin: 32px auto; max-width: 980px; padding: 0 16px; color: #111; }}
-    h1 {{ margin: 0 0 10px; }} h2 {{ margin: 24px 0 10px; }}
-    p {{ color: #555; margin: 0 0 16px; }}
-    table {{ width: 100%; border-collapse: collapse; }}
-    th, td {{ border: 1px solid #e5e7eb; padding: 10px; text-align: left; }}
-    th {{ background: #f5f5f5; }}
-    td.num {{ text-align: left; width: 70px; }}
-    a {{ color: #0b57d0; text-decoration: none; }}
-    a:hover {{ text-decoration: underline; }}
+    body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif; margin: 32px auto; max-width: 980px; padding: 0 16px; color: #111; }
+    h1 { margin: 0 0 10px; } h2 { margin: 24px 0 10px; }
+    p { color: #555; margin: 0 0 16px; }
+    table { width: 100%; border-collapse: collapse; }
+    th, td { border: 1px solid #e5e7eb; padding: 10px; text-align: left; }
+    th { background: #f5f5f5; }
+    td.num { text-align: left; width: 70px; }
+    a { color: #0b57d0; text-decoration: none; }
+    a:hover { text-decoration: underline; }
   </style>
 </head>
 <body>
@@ -65,16 +42,50 @@ def regenerate_index(repo_root: Path, mode: str) -> None:
   <h2>Current Reports</h2>
   <table>
     <thead><tr><th>#</th><th>Report Name</th><th>Published (UTC)</th><th>Link</th></tr></thead>
-    <tbody>{current_tbody}</tbody>
+    <tbody>"""
+
+_INDEX_MID = """</tbody>
   </table>
   <h2>Archive</h2>
   <table>
     <thead><tr><th>#</th><th>Report Name</th><th>Published (UTC)</th><th>Link</th></tr></thead>
-    <tbody>{archive_tbody}</tbody>
+    <tbody>"""
+
+_INDEX_TAIL = """</tbody>
   </table>
 </body>
 </html>
 """
+
+
+def regenerate_index(repo_root: Path, mode: str) -> None:
+    runs = repo_root / "outputs" / mode / "runs"
+    archive = repo_root / "outputs" / mode / "archive"
+    runs.mkdir(parents=True, exist_ok=True)
+    archive.mkdir(parents=True, exist_ok=True)
+
+    current_files = sorted([p for p in runs.glob("*.html") if p.name != "index.html"])
+    archive_files = sorted([p for p in archive.glob("*.html")])
+
+    current_rows = report_rows_for_index(current_files)
+    archive_rows = report_rows_for_index(archive_files)
+
+    def _rows_html(rows: list[tuple[str, str, float, str]], prefix: str = "") -> str:
+        if not rows:
+            return "<tr><td colspan='4'>No reports found.</td></tr>"
+        count = len(rows)
+        # Feed the row generator straight into join instead of accumulating
+        # an intermediate list alongside the joined string.
+        return "\n".join(
+            f"<tr><td class='num'>{count - i}</td><td>{stem}</td><td>{dt}</td>"
+            f"<td><a href='{prefix}{fname}'>{fname}</a></td></tr>"
+            for i, (fname, stem, _, dt) in enumerate(rows)
+        )
+
+    current_tbody = _rows_html(current_rows, "")
+    archive_tbody = _rows_html(archive_rows, "archive/")
+
+    html = "".join([_INDEX_HEAD, current_tbody, _INDEX_MID, archive_tbody, _INDEX_TAIL])
     (runs / "index.html").write_text(html, encoding="utf-8")
 
 
@@ -147,10 +158,13 @@ def main() -> int:
     shutil.move(str(source_path), str(versioned_path))
 
     regenerate_index(repo_root, mode)
-    run(["git", "add", "-A"], repo_root)
 
-    has_staged = subprocess.call(["git", "diff", "--cached", "--quiet"], cwd=str(repo_root)) != 0
-    if has_staged:
+    # One porcelain status replaces the add + diff-cached spawn pair: it
+    # lists staged, unstaged, and untracked paths, so a non-empty result is
+    # exactly the case where add -A produces something to commit.
+    dirty = run(["git", "status", "--porcelain", "-z"], repo_root)
+    if dirty:
+        run(["git", "add", "-A"], repo_root)
         run_pytest(workspace)
         run(["git", "commit", "-m", f"Publish {strategy} report"], repo_root)
         run(["git", "push", "origin", "main"], repo_root)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict
 
 import pandas as pd
 
-import yaml
-
 from .compat import normalize_legacy_config
 from .config_schema import EngineConfig, parse_engine_config
 from .factory import build_pipeline
 
+# Raw YAML documents keyed by on-disk version. The cache stops at the raw
+# dict rather than the EngineConfig: normalize_legacy_config deep-copies its
+# input, so every from_yaml still hands out independent params dicts (the
+# backtest mutates allocation_model.params per strategy).
+_RAW_YAML_CACHE: dict[tuple[str, int, int], dict] = {}
+
 
 @dataclass
 class PortfolioEngine:
@@ -20,12 +26,31 @@ class PortfolioEngine:
 
     @classmethod
     def from_yaml(cls, config_path: str | Path) -> "PortfolioEngine":
-        with open(config_path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        st = os.stat(config_path)
+        key = (str(config_path), st.st_mtime_ns, st.st_size)
+        raw = _RAW_YAML_CACHE.get(key)
+        if raw is None:
+            # Deferred so importing the engine (e.g. constructing from an
+            # in-memory EngineConfig) never pays for the yaml bindings;
+            # CSafeLoader is the libyaml parser, SafeLoader the fallback.
+            import yaml
+
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(config_path, "r", encoding="utf-8") as f:
+                raw = _RAW_YAML_CACHE[key] = yaml.load(f, Loader=loader)
         normalized = normalize_legacy_config(raw)
         config = parse_engine_config(normalized)
         return cls(config=config)
 
+    @cached_property
+    def _pipeline(self):
+        # Built on first run() rather than at construction: the backtest
+        # injects portfolio weights into config.allocation_model.params after
+        # from_yaml, and the pipeline must be instantiated from the final
+        # params. All registry modules are stateless, so one pipeline serves
+        # every subsequent call.
+        return build_pipeline(self.config)
+
     def run(
         self,
         as_of_date: date,
@@ -33,8 +58,10 @@ class PortfolioEngine:
         portfolio_value: float,
         current_positions: Dict[str, float],
         last_rebalance_date: date | None,
+        *,
+        eager_allocations: bool = True,
     ) -> Dict[str, Any]:
-        pipeline = build_pipeline(self.config)
+        pipeline = self._pipeline
         context: Dict[str, Any] = {
             "constraints": {
                 "leverage": self.config.constraints.leverage,
@@ -59,19 +86,28 @@ class PortfolioEngine:
             context=context,
         )
 
-        allocations = pipeline.allocator.allocate(
-            weights=weights,
-            portfolio_value=portfolio_value,
-            prices=prices,
-            context=context,
-        )
-
-        target_positions = {
-            symbol: alloc["target_units"] for symbol, alloc in allocations.items()
-        }
+        # Allocations are only needed to derive trades; callers that loop over
+        # non-rebalance dates (the backtest) can opt out of paying for them
+        # when no rebalance fires. The per-symbol dict layout is built only
+        # for eager callers — trades come straight from the columnar result.
+        allocations: Dict[str, Dict[str, float]] = {}
+        if eager_allocations:
+            allocations = pipeline.allocator.allocate(
+                weights=weights,
+                portfolio_value=portfolio_value,
+                prices=prices,
+                context=context,
+            )
 
         trades: Dict[str, float] = {}
         if should_rebalance:
+            symbols, _, _, target_units = pipeline.allocator.allocate_arrays(
+                weights=weights,
+                portfolio_value=portfolio_value,
+                prices=prices,
+                context=context,
+            )
+            target_positions = dict(zip(symbols, target_units.tolist()))
             trades = pipeline.rebalancer.generate_trades(
                 current_positions=current_positions,
                 target_positions=target_positions,
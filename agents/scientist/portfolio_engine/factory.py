@@ -15,10 +15,25 @@ class Pipeline:
     allocator: Allocator
 
 
+# Constructed modules shared across pipelines, keyed on registry identity,
+# type, and frozen params. Registry modules are stateless (or carry only
+# internal memoization), so identical configurations can share one instance.
+_MODULE_CACHE: dict[tuple[int, str, frozenset], object] = {}
+
+
 def _build_typed(registry: dict[str, type], module_type: str, params: dict):
     if module_type not in registry:
         raise KeyError(f"Unknown module type: {module_type}")
-    return registry[module_type](**params)
+    try:
+        key = (id(registry), module_type, frozenset(params.items()))
+    except TypeError:
+        # Unhashable params (e.g. the allocation model's weights dict) get a
+        # fresh instance; those are exactly the ones mutated per strategy.
+        return registry[module_type](**params)
+    instance = _MODULE_CACHE.get(key)
+    if instance is None:
+        instance = _MODULE_CACHE[key] = registry[module_type](**params)
+    return instance
 
 
 def build_pipeline(cfg: EngineConfig) -> Pipeline:
@@ -1,33 +1,65 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 
 class CapitalAllocator:
     """Converts target weights to target notionals and unit counts."""
 
-    def allocate(
+    def allocate_arrays(
         self,
         *,
         weights: Dict[str, float],
         portfolio_value: float,
         prices: Dict[str, float],
         context: Dict[str, Any] | None = None,
-    ) -> Dict[str, Dict[str, float]]:
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Columnar allocation: (symbols, weights, notionals, units) aligned.
+
+        This is the structure-of-arrays core; allocate() wraps it in the
+        per-symbol dict layout for callers that want the classic view.
+        """
         if portfolio_value < 0:
             raise ValueError("portfolio_value must be non-negative")
 
-        allocations: Dict[str, Dict[str, float]] = {}
-        for symbol, weight in weights.items():
-            if symbol not in prices:
-                raise KeyError(f"Missing price for {symbol}")
-            px = prices[symbol]
-            if px <= 0:
-                raise ValueError(f"Invalid non-positive price for {symbol}")
-
-            target_notional = portfolio_value * weight
-            target_units = target_notional / px
-            allocations[symbol] = {
+        symbols = list(weights)
+        n = len(symbols)
+        w = np.fromiter(weights.values(), dtype=np.float64, count=n)
+        try:
+            p = np.fromiter((prices[s] for s in symbols), dtype=np.float64, count=n)
+        except KeyError as exc:
+            raise KeyError(f"Missing price for {exc.args[0]}") from None
+        if n and p.min() <= 0:
+            bad = symbols[int(np.argmax(p <= 0))]
+            raise ValueError(f"Invalid non-positive price for {bad}")
+
+        target_notionals = portfolio_value * w
+        target_units = target_notionals / p
+        return symbols, w, target_notionals, target_units
+
+    def allocate(
+        self,
+        *,
+        weights: Dict[str, float],
+        portfolio_value: float,
+        prices: Dict[str, float],
+        context: Dict[str, Any] | None = None,
+    ) -> Dict[str, Dict[str, float]]:
+        symbols, w, target_notionals, target_units = self.allocate_arrays(
+            weights=weights,
+            portfolio_value=portfolio_value,
+            prices=prices,
+            context=context,
+        )
+        # tolist() hands back bit-identical Python floats, so downstream
+        # scalar math is unchanged versus the historical per-symbol loop.
+        notionals = target_notionals.tolist()
+        units = target_units.tolist()
+        return {
+            symbol: {
                 "weight": weight,
-                "target_notional": target_notional,
-                "target_units": target_units,
+                "target_notional": notionals[i],
+                "target_units": units[i],
             }
-        return allocations
+            for i, (symbol, weight) in enumerate(weights.items())
+        }
@@ -1,10 +1,19 @@
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import numpy as np
 
 
 class MonthlyRebalancer:
     """Monthly schedule; rebalance on first observed trading day of month."""
 
+    def __init__(self) -> None:
+        # Sorted symbol order memoized per (current, target) key shape; in a
+        # backtest the universe is stable, so the union + sort runs once
+        # instead of every rebalance. Sorted order is part of the contract:
+        # trade application order affects cash arithmetic downstream.
+        self._order_cache: Dict[tuple, tuple] = {}
+
     def should_rebalance(
         self,
         *,
@@ -14,9 +23,11 @@ class MonthlyRebalancer:
     ) -> bool:
         if last_rebalance_date is None:
             return True
-        return (as_of_date.year, as_of_date.month) != (
-            last_rebalance_date.year,
-            last_rebalance_date.month,
+        # Short-circuit on month (which almost always differs first) and skip
+        # the tuple allocations of the old (year, month) comparison.
+        return (
+            as_of_date.month != last_rebalance_date.month
+            or as_of_date.year != last_rebalance_date.year
         )
 
     def generate_trades(
@@ -26,8 +37,32 @@ class MonthlyRebalancer:
         target_positions: Dict[str, float],
         context: Dict[str, Any] | None = None,
     ) -> Dict[str, float]:
-        symbols = set(current_positions) | set(target_positions)
+        key = (tuple(current_positions), tuple(target_positions))
+        order = self._order_cache.get(key)
+        if order is None:
+            order = self._order_cache[key] = tuple(sorted(set(key[0]) | set(key[1])))
         return {
             symbol: target_positions.get(symbol, 0.0) - current_positions.get(symbol, 0.0)
-            for symbol in sorted(symbols)
+            for symbol in order
         }
+
+    def generate_trades_arrays(
+        self,
+        *,
+        symbols: List[str],
+        current_units: np.ndarray,
+        target_units: np.ndarray,
+        context: Dict[str, Any] | None = None,
+    ) -> Dict[str, float]:
+        """Vectorized trade generation over a pre-aligned symbol universe.
+
+        Companion to the allocator's columnar output: the caller supplies
+        current and target unit arrays aligned to ``symbols`` (covering the
+        full universe), and the diff is one array op instead of two dict
+        probes per symbol. Exact-zero diffs are pruned; such entries are
+        numerical no-ops in the dict form.
+        """
+        diff = target_units - current_units
+        idx = np.flatnonzero(diff != 0.0)
+        traded = diff[idx].tolist()
+        return {symbols[j]: traded[i] for i, j in enumerate(idx)}
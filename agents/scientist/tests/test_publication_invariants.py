@@ -1,8 +1,23 @@
+import mmap
 from pathlib import Path
 
+import pytest
+
 from policy import ensure_timestamped_report_name, parse_report_timestamp_utc, report_rows_for_index
 
 
+@pytest.fixture(scope="module")
+def publish_src():
+    """publish.py mapped read-only once for all source-invariant checks."""
+    publish_py = Path(__file__).resolve().parents[1] / "engine" / "publish.py"
+    with publish_py.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
 def test_timestamped_report_name_rule():
     ensure_timestamped_report_name("2026-02-21_00-17_beta-engine-60-40.html", "beta-engine-60-40")
 
@@ -27,18 +42,14 @@ def test_index_rows_use_filename_timestamp_and_legacy():
     assert rows[2][3] == "Legacy"
 
 
-def test_publish_script_contains_required_head_parity_check():
-    publish_py = Path(__file__).resolve().parents[1] / "publish.py"
-    src = publish_py.read_text(encoding="utf-8")
-    assert "enforce_head_parity" in src
-    assert "HEAD_MATCH: true" in src
+def test_publish_script_contains_required_head_parity_check(publish_src):
+    assert publish_src.find(b"enforce_head_parity") >= 0
+    assert publish_src.find(b"HEAD_MATCH: true") >= 0
 
 
-def test_publish_runs_pytest_before_push():
-    publish_py = Path(__file__).resolve().parents[1] / "publish.py"
-    src = publish_py.read_text(encoding="utf-8")
-    assert "-m\", \"pytest\"" in src or "pytest" in src
-    assert "run_pytest(workspace)" in src
+def test_publish_runs_pytest_before_push(publish_src):
+    assert publish_src.find(b"-m\", \"pytest\"") >= 0 or publish_src.find(b"pytest") >= 0
+    assert publish_src.find(b"run_pytest(workspace)") >= 0
 
 
 def test_parse_timestamp_utc():
@@ -0,0 +1,21 @@
+import numpy as np
+
+from portfolio_engine.rebalancer import MonthlyRebalancer
+
+
+def test_array_trades_match_dict_trades_on_aligned_universe():
+    reb = MonthlyRebalancer()
+    symbols = ["AGG", "SPY", "TLT"]
+    current = {"AGG": 2.0, "SPY": 5.0, "TLT": 5.0}
+    target = {"AGG": 2.0, "SPY": 6.0, "TLT": 4.0}
+
+    dict_trades = reb.generate_trades(current_positions=current, target_positions=target)
+    array_trades = reb.generate_trades_arrays(
+        symbols=symbols,
+        current_units=np.array([current[s] for s in symbols]),
+        target_units=np.array([target[s] for s in symbols]),
+    )
+
+    # The array path prunes exact-zero diffs; the remaining trades must match.
+    assert array_trades == {s: t for s, t in dict_trades.items() if t != 0.0}
+    assert array_trades == {"SPY": 1.0, "TLT": -1.0}
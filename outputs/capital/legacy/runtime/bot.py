@@ -25,6 +25,11 @@ async def on_message(message):
     if message.author == client.user:
         return
 
+    # Cheap first-character check so ordinary chat traffic bails out
+    # before allocating a stripped copy of every message.
+    if not message.content or message.content[0] != "/":
+        return
+
     content = message.content.strip()
 
     if content.startswith("/node"):